@@ -1,8 +1,11 @@
+import asyncio
 import re
-import json
 import logging
 from datetime import datetime, timezone
+from typing import Awaitable, Callable
+from uuid import uuid4
 
+import orjson
 from openai import AsyncOpenAI
 
 from config import settings
@@ -67,6 +70,12 @@ Classe l'événement d'actualité avec ce schéma exact :
 }
 
 
+# Resolved once — the language doesn't change at runtime, so there's no need
+# to re-look-up the prompt or rebuild the system message per evaluation.
+SYSTEM_PROMPT = SYSTEM_PROMPTS.get(settings.pythia_language, SYSTEM_PROMPTS["en"])
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+
+
 _CATEGORY_RANGES = {
     "NOMINAL": (1, 3),
     "ELEVATED SCRUTINY": (4, 5),
@@ -76,27 +85,185 @@ _CATEGORY_RANGES = {
 }
 
 
+# Compiled once — these run on every LLM response
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
 def _strip_thinking(text: str) -> str:
     """Remove <think>...</think> blocks emitted by reasoning models (e.g. Qwen3)."""
-    return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+    if "<think>" not in text:  # fast path for non-reasoning models
+        return text.strip()
+    return _THINK_RE.sub("", text).strip()
+
+
+class _StreamingJsonExtractor:
+    """Incrementally extracts the first top-level JSON object from a delta stream.
+
+    Skips <think>...</think> blocks and tracks brace depth (quote- and
+    escape-aware), so the caller can stop consuming the stream as soon as the
+    closing brace arrives instead of draining the model's full response.
+    Handles tags and braces split across delta boundaries via a small
+    carryover buffer.
+
+    With collect_pairs=True, every completed top-level "key": value pair is
+    also appended to `pairs` as soon as its trailing comma (or the closing
+    brace) arrives, enabling partial publishing before the object completes.
+    """
+
+    def __init__(self, collect_pairs: bool = False) -> None:
+        self.result: str | None = None
+        self.pairs: list[tuple[str, object]] = []
+        self._collect_pairs = collect_pairs
+        self._pending = ""  # carryover for a "<think>"/"</think>" split across deltas
+        self._in_think = False
+        self._started = False  # inside the JSON object
+        self._in_string = False
+        self._escaped = False
+        self._depth = 0
+        self._bracket_depth = 0
+        self._parts: list[str] = []
+        self._pair_parts: list[str] = []
+
+    def _flush_pair(self, piece: str) -> None:
+        pair = ("".join(self._pair_parts) + piece).strip()
+        self._pair_parts = []
+        if not pair:
+            return
+        try:
+            obj = orjson.loads("{" + pair + "}")
+        except orjson.JSONDecodeError:
+            return
+        self.pairs.extend(obj.items())
 
+    def feed(self, delta: str) -> bool:
+        """Consume one delta. Returns True once a complete object is available."""
+        if self.result is not None:
+            return True
+        text = self._pending + delta
+        self._pending = ""
+        i, n = 0, len(text)
 
-def _extract_json(text: str) -> dict:
+        while i < n:
+            if self._in_think:
+                end = text.find("</think>", i)
+                if end == -1:
+                    # keep a tail in case "</think>" is split across deltas
+                    self._pending = text[max(i, n - 7):]
+                    return False
+                i = end + 8
+                self._in_think = False
+            elif not self._started:
+                lt = text.find("<", i)
+                brace = text.find("{", i)
+                if brace == -1 and lt == -1:
+                    return False
+                if lt != -1 and (brace == -1 or lt < brace):
+                    frag = text[lt : lt + 7]
+                    if frag == "<think>":
+                        self._in_think = True
+                        i = lt + 7
+                    elif len(frag) < 7 and "<think>".startswith(frag):
+                        self._pending = text[lt:]
+                        return False
+                    else:
+                        i = lt + 1
+                else:
+                    self._started = True
+                    i = brace
+            else:
+                start = i
+                seg_start = i  # start of the current top-level pair segment
+                while i < n:
+                    c = text[i]
+                    i += 1
+                    if self._in_string:
+                        if self._escaped:
+                            self._escaped = False
+                        elif c == "\\":
+                            self._escaped = True
+                        elif c == '"':
+                            self._in_string = False
+                    elif c == '"':
+                        self._in_string = True
+                    elif c == "{":
+                        self._depth += 1
+                        if self._depth == 1:
+                            seg_start = i  # first char after the opening brace
+                    elif c == "[":
+                        self._bracket_depth += 1
+                    elif c == "]":
+                        self._bracket_depth -= 1
+                    elif (
+                        c == ","
+                        and self._collect_pairs
+                        and self._depth == 1
+                        and self._bracket_depth == 0
+                    ):
+                        self._flush_pair(text[seg_start : i - 1])
+                        seg_start = i
+                    elif c == "}":
+                        self._depth -= 1
+                        if self._depth == 0:
+                            if self._collect_pairs:
+                                self._flush_pair(text[seg_start : i - 1])
+                            self._parts.append(text[start:i])
+                            self.result = "".join(self._parts)
+                            return True
+                self._parts.append(text[start:])
+                if self._collect_pairs:
+                    self._pair_parts.append(text[seg_start:])
+
+        return False
+
+
+def _extract_json(raw: bytes | str) -> dict:
+    # Try direct parse first — the common case when the model obeys the prompt
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        pass
+    text = raw.decode() if isinstance(raw, bytes) else raw
     text = _strip_thinking(text)
-    # Try direct parse first
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
         pass
     # Fall back: find the first {...} block
-    match = re.search(r"\{.*\}", text, re.DOTALL)
+    match = _JSON_RE.search(text)
     if match:
-        return json.loads(match.group(0))
+        return orjson.loads(match.group(0))
     raise ValueError(f"No valid JSON found in model response: {text[:300]!r}")
 
 
-async def evaluate(event: RawEvent, retries: int = 2) -> EvaluatedEvent | None:
-    system_prompt = SYSTEM_PROMPTS.get(settings.pythia_language, SYSTEM_PROMPTS["en"])
+# Gate on concurrent LLM calls — sources gather their evaluations, so bursts
+# from several feeds could otherwise flood the backend with dozens of
+# simultaneous requests. Keeping a few in flight lets the server batch
+# prompts; unbounded fan-out mostly adds queueing and timeouts.
+_eval_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+
+
+async def evaluate(
+    event: RawEvent,
+    retries: int = 2,
+    on_partial: Callable[[str, str, object], Awaitable[None]] | None = None,
+) -> EvaluatedEvent | None:
+    """Classify a raw event via the LLM.
+
+    When `on_partial` is given it is awaited as `(event_id, field, value)` for
+    each top-level JSON field the moment it completes in the stream, so
+    clients can render the evaluation before the full response lands.
+    """
+    async with _eval_semaphore:
+        return await _evaluate(event, retries, on_partial)
+
+
+async def _evaluate(
+    event: RawEvent,
+    retries: int,
+    on_partial: Callable[[str, str, object], Awaitable[None]] | None,
+) -> EvaluatedEvent | None:
+    event_id = uuid4().hex
     user_content = (
         f"Title: {event.title}\n"
         f"Source: {event.source_name}\n"
@@ -106,11 +273,13 @@ async def evaluate(event: RawEvent, retries: int = 2) -> EvaluatedEvent | None:
     for attempt in range(retries + 1):
         try:
             # Use streaming to avoid timeout waiting for full response on slow hardware
-            raw_chunks: list[str] = []
+            buf = bytearray()
+            extractor = _StreamingJsonExtractor(collect_pairs=on_partial is not None)
+            emitted = 0
             stream = await client.chat.completions.create(
                 model=settings.llm_model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    _SYSTEM_MSG,
                     {"role": "user", "content": user_content},
                 ],
                 temperature=0.1,
@@ -119,11 +288,26 @@ async def evaluate(event: RawEvent, retries: int = 2) -> EvaluatedEvent | None:
             )
             async for chunk in stream:
                 delta = chunk.choices[0].delta.content
-                if delta:
-                    raw_chunks.append(delta)
+                if not delta:
+                    continue
+                buf.extend(delta.encode())
+                done = extractor.feed(delta)
+                if on_partial is not None:
+                    while emitted < len(extractor.pairs):
+                        field, value = extractor.pairs[emitted]
+                        emitted += 1
+                        await on_partial(event_id, field, value)
+                if done:
+                    break
 
-            raw = "".join(raw_chunks)
-            data = _extract_json(raw)
+            if extractor.result is not None:
+                # The object is complete — stop generating remaining tokens
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    await close()
+                data = _extract_json(extractor.result)
+            else:
+                data = _extract_json(bytes(buf))
 
             criticality = float(data["criticality"])
             if not (1.0 <= criticality <= 10.0):
@@ -139,13 +323,17 @@ async def evaluate(event: RawEvent, retries: int = 2) -> EvaluatedEvent | None:
                     f"Category {category!r} requires criticality {lo}–{hi}, got {criticality}"
                 )
 
-            return EvaluatedEvent(
+            location = data.get("location")
+            # Fields are validated/coerced explicitly above, so skip the
+            # redundant full Pydantic validation pass on this internal path.
+            return EvaluatedEvent.model_construct(
+                id=event_id,
                 criticality=criticality,
-                category=data["category"],
-                title=data.get("title", event.title),
-                summary=data["summary"],
-                location=data.get("location"),
-                source=data.get("source", event.source_name),
+                category=category,
+                title=str(data.get("title") or event.title),
+                summary=str(data["summary"]),
+                location=str(location) if location is not None else None,
+                source=str(data.get("source") or event.source_name),
                 timestamp=(
                     (event.raw_data or {}).get("published_at")
                     or datetime.now(timezone.utc).isoformat()
@@ -1,7 +1,8 @@
+import asyncio
 import logging
 from collections import deque
-from typing import Set
 
+import orjson
 from fastapi import WebSocket
 
 from models import EvaluatedEvent
@@ -14,41 +15,75 @@ HISTORY_MAXLEN = 100
 
 class EventQueue:
     def __init__(self) -> None:
-        self._history: deque[dict] = deque(maxlen=HISTORY_MAXLEN)
-        self._connections: Set[WebSocket] = set()
+        # History is stored as pre-serialized frames — it is only ever read to
+        # replay to new clients, so keeping dicts alongside just wasted memory.
+        # The rarely-hit `history` property decodes on demand.
+        self._history: deque[str] = deque(maxlen=HISTORY_MAXLEN)
+        # Insertion-ordered list — iterated on every publish, so it's the hot
+        # structure; removal is rare (disconnects) and handled by identity
+        self._connections: list[WebSocket] = []
 
     async def connect(self, ws: WebSocket) -> None:
         await ws.accept()
-        self._connections.add(ws)
+        self._connections.append(ws)
         logger.info("WebSocket connected. Active connections: %d", len(self._connections))
-        # Replay history to the new client
-        for event in self._history:
-            try:
-                await ws.send_json(event)
-            except Exception:
-                break
+        # Replay history to the new client — pipeline the writes instead of
+        # awaiting each frame's TCP write sequentially
+        if self._history:
+            await asyncio.gather(
+                *(ws.send_text(p) for p in self._history),
+                return_exceptions=True,
+            )
 
     def disconnect(self, ws: WebSocket) -> None:
-        self._connections.discard(ws)
+        self._connections = [c for c in self._connections if c is not ws]
         logger.info("WebSocket disconnected. Active connections: %d", len(self._connections))
 
     async def publish(self, event: EvaluatedEvent) -> None:
-        data = event.model_dump()
-        self._history.append(data)
+        # Serialize once — send_json would re-encode the dict per connection
+        payload = orjson.dumps(event.model_dump()).decode()
+        self._history.append(payload)
 
-        dead: Set[WebSocket] = set()
-        for ws in self._connections:
-            try:
-                await ws.send_json(data)
-            except Exception as e:
-                logger.warning("Failed to send to WebSocket client: %s", e)
-                dead.add(ws)
+        if not self._connections:
+            return
 
-        self._connections -= dead
+        # Dispatch all writes concurrently — total publish time becomes the
+        # slowest client's write, not the sum of all of them
+        conns = list(self._connections)
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in conns), return_exceptions=True
+        )
+
+        dead: set[int] = set()
+        for ws, result in zip(conns, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to send to WebSocket client: %s", result)
+                dead.add(id(ws))
+
+        if dead:
+            # Single-pass rebuild; keeps clients that connected during the sends
+            self._connections = [c for c in self._connections if id(c) not in dead]
+
+    async def publish_partial(self, event_id: str, field: str, value: object) -> None:
+        """Push one completed field of an in-flight evaluation.
+
+        Partial frames carry {"type": "partial"} so clients can merge them by
+        event id; they are not stored in history. Dead connections are left
+        for the final publish to prune.
+        """
+        if not self._connections:
+            return
+        payload = orjson.dumps(
+            {"type": "partial", "id": event_id, "field": field, "value": value}
+        ).decode()
+        await asyncio.gather(
+            *(ws.send_text(payload) for ws in list(self._connections)),
+            return_exceptions=True,
+        )
 
     @property
     def history(self) -> list[dict]:
-        return list(self._history)
+        return [orjson.loads(p) for p in self._history]
 
     @property
     def connection_count(self) -> int:
@@ -2,8 +2,19 @@ import logging
 from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 
+# The whole backend is socket-bound async I/O (LLM streaming, WebSocket
+# fan-out, HTTP polling) — prefer the libuv loop when available. uvicorn
+# picks it up on its own; this covers any other entry point.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from config import settings, load_sources
 from event_queue import queue
@@ -51,9 +62,16 @@ async def lifespan(app: FastAPI):
 
     for task in tasks:
         task.cancel()
+    for source in pull_sources:
+        await source.aclose()
 
 
-app = FastAPI(title="PYTHIA", version="0.1.0", lifespan=lifespan)
+app = FastAPI(
+    title="PYTHIA",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
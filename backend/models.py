@@ -12,6 +12,8 @@ class RawEvent(BaseModel):
 
 
 class EvaluatedEvent(BaseModel):
+    # Correlates the final event with any "partial" frames streamed before it
+    id: Optional[str] = None
     criticality: float
     category: str
     title: str
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from typing import List
 
 from sources.base import BaseSource
@@ -17,26 +18,43 @@ source_health: dict[str, bool] = {}
 async def _poll_source(source: BaseSource) -> None:
     interval: int = source.config.get("interval", 300)
     name = source.get_name()
+    # Local float — avoids a Pydantic settings attribute walk per event
+    threshold = float(settings.criticality_threshold)
     logger.info("Polling started for %s (interval: %ds)", name, interval)
 
     error_count = 0
+    # Fixed-cadence schedule: sleeping a flat `interval` after each poll would
+    # stretch the effective period by however long fetch + evaluation took
+    next_tick = time.monotonic()
 
     while True:
         try:
             events = await source.fetch()
             source_health[name] = True
             error_count = 0
-            for raw_event in events:
-                evaluated = await evaluate(raw_event)
+            # Evaluate all events from this poll concurrently — each call is an
+            # independent I/O round-trip to the LLM, so overlapping them cuts
+            # per-poll time from O(N × latency) to O(latency).
+            results = await asyncio.gather(
+                *(evaluate(e, on_partial=queue.publish_partial) for e in events),
+                return_exceptions=True,
+            )
+            for raw_event, evaluated in zip(events, results):
+                if isinstance(evaluated, BaseException):
+                    logger.error(
+                        "Evaluation failed for %r: %s", raw_event.title, evaluated
+                    )
+                    continue
                 if evaluated is None:
                     continue
-                if evaluated.criticality < settings.criticality_threshold:
-                    logger.debug(
-                        "Event below threshold (%.1f < %.1f): %s",
-                        evaluated.criticality,
-                        settings.criticality_threshold,
-                        evaluated.title,
-                    )
+                if evaluated.criticality < threshold:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Event below threshold (%.1f < %.1f): %s",
+                            evaluated.criticality,
+                            threshold,
+                            evaluated.title,
+                        )
                     continue
                 logger.info(
                     "[%s] criticality=%.1f category=%s — %s",
@@ -58,9 +76,19 @@ async def _poll_source(source: BaseSource) -> None:
                 name, error_count, backoff, e,
             )
             await asyncio.sleep(backoff)
+            next_tick = time.monotonic()
             continue
 
-        await asyncio.sleep(interval)
+        next_tick += interval
+        sleep_for = next_tick - time.monotonic()
+        if sleep_for < 0:
+            logger.warning(
+                "Poll cycle for %s overran its %ds interval by %.1fs",
+                name, interval, -sleep_for,
+            )
+            next_tick = time.monotonic()
+            sleep_for = 0
+        await asyncio.sleep(sleep_for)
 
 
 def start_scheduler(sources: List[BaseSource]) -> List[asyncio.Task]:
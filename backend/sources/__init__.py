@@ -1,4 +1,4 @@
-from sources.base import BaseSource
+from sources.base import BaseSource, fetch_many
 from sources.rss import RSSSource
 from sources.uptime_kuma import UptimeKumaSource
 from sources.webhook import WebhookSource
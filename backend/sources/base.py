@@ -1,9 +1,22 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Union
 
 from models import RawEvent
 
 
+async def fetch_many(
+    sources: List["BaseSource"],
+) -> List[Union[List[RawEvent], BaseException]]:
+    """Fetch all sources concurrently.
+
+    Each source's exception is returned in its slot instead of raised, so one
+    failing feed can't mask the others. Sources are I/O-bound and keep their
+    mutable state per-instance, so overlapping them is safe.
+    """
+    return await asyncio.gather(*(s.fetch() for s in sources), return_exceptions=True)
+
+
 class BaseSource(ABC):
     def __init__(self, config: dict) -> None:
         self.config = config
@@ -13,6 +26,9 @@ class BaseSource(ABC):
         """Pull new events. Return an empty list if nothing new."""
         ...
 
+    async def aclose(self) -> None:
+        """Release long-lived resources (HTTP clients, ...). Called on shutdown."""
+
     def get_name(self) -> str:
         return self.config.get("name", self.__class__.__name__)
 
@@ -25,24 +25,38 @@ class UptimeKumaSource(BaseSource):
         super().__init__(config)
         # monitor_id -> last known status (1=up, 0=down)
         self._last_states: Dict[str, int] = {}
+        # Long-lived client — reuses keep-alive connections across polls
+        # instead of paying TCP + TLS setup on every fetch
+        self._client = httpx.AsyncClient(timeout=10.0)
+        # Auth headers never change, so build them once
+        if api_key := config.get("api_key"):
+            self._headers = {"Authorization": f"Bearer {api_key}"}
+        else:
+            self._headers = {}
+        # Hash of the last response body — unchanged bodies skip JSON parsing
+        self._last_body_hash: int | None = None
 
     def get_type(self) -> str:
         return "uptime_kuma"
 
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
     async def fetch(self) -> List[RawEvent]:
         base_url = self.config["url"].rstrip("/")
         slug = self.config.get("slug", "default")
         endpoint = f"{base_url}/api/status-page/heartbeat/{slug}"
 
-        headers = {}
-        if api_key := self.config.get("api_key"):
-            headers["Authorization"] = f"Bearer {api_key}"
-
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(endpoint, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self._client.get(endpoint, headers=self._headers)
+            resp.raise_for_status()
+            # Stable monitors return the same body poll after poll — skip the
+            # JSON parse and the heartbeat walk entirely when nothing changed
+            body_hash = hash(resp.content)
+            if body_hash == self._last_body_hash:
+                return []
+            data = resp.json()
+            self._last_body_hash = body_hash
         except Exception as e:
             logger.error("Uptime Kuma fetch error for %s: %s", self.get_name(), e)
             return []
@@ -3,7 +3,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from evaluator import _extract_json, _strip_thinking, evaluate
+from evaluator import _extract_json, _strip_thinking, _StreamingJsonExtractor, evaluate
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -104,6 +104,56 @@ def test_extract_json_raises_on_empty():
         _extract_json("")
 
 
+# ─── _StreamingJsonExtractor ──────────────────────────────────────────────────
+
+
+def _feed_in_chunks(text, size=3):
+    extractor = _StreamingJsonExtractor()
+    for i in range(0, len(text), size):
+        if extractor.feed(text[i : i + size]):
+            break
+    return extractor
+
+
+def test_streaming_extractor_finds_object_across_chunks():
+    extractor = _feed_in_chunks('{"criticality": 5.0, "category": "NOMINAL"}')
+    assert extractor.result == '{"criticality": 5.0, "category": "NOMINAL"}'
+
+
+def test_streaming_extractor_skips_think_block_split_across_chunks():
+    extractor = _feed_in_chunks('<think>{"fake": 1} reasoning</think>{"real": 2}')
+    assert extractor.result == '{"real": 2}'
+
+
+def test_streaming_extractor_ignores_braces_inside_strings():
+    extractor = _feed_in_chunks('{"summary": "a } b { c", "criticality": 3.0}')
+    assert extractor.result == '{"summary": "a } b { c", "criticality": 3.0}'
+
+
+def test_streaming_extractor_stops_at_first_complete_object():
+    extractor = _StreamingJsonExtractor()
+    assert extractor.feed('{"a": 1} trailing text never parsed')
+    assert extractor.result == '{"a": 1}'
+
+
+def test_streaming_extractor_incomplete_object_yields_no_result():
+    extractor = _feed_in_chunks('{"a": 1, "b":')
+    assert extractor.result is None
+
+
+def test_streaming_extractor_collects_pairs_as_they_complete():
+    extractor = _StreamingJsonExtractor(collect_pairs=True)
+    text = '{"criticality": 7.0, "category": "DIVERGENCE", "title": "T"}'
+    for i in range(0, len(text), 5):
+        if extractor.feed(text[i : i + 5]):
+            break
+    assert extractor.pairs == [
+        ("criticality", 7.0),
+        ("category", "DIVERGENCE"),
+        ("title", "T"),
+    ]
+
+
 # ─── evaluate() ───────────────────────────────────────────────────────────────
 
 
@@ -169,6 +219,47 @@ async def test_evaluate_returns_none_when_all_attempts_fail(raw_event):
     assert mock_client.chat.completions.create.call_count == 2  # 1 + 1 retry
 
 
+async def test_evaluate_emits_partials_while_streaming(raw_event):
+    partials = []
+
+    async def on_partial(event_id, field, value):
+        partials.append((event_id, field, value))
+
+    with patch("evaluator.client") as mock_client:
+        mock_client.chat.completions.create = AsyncMock(return_value=FakeStream(VALID_LLM_RESPONSE))
+
+        result = await evaluate(raw_event, on_partial=on_partial)
+
+    assert result is not None
+    fields = [f for _, f, _ in partials]
+    assert "criticality" in fields
+    assert "category" in fields
+    # All partials belong to the final event
+    assert all(event_id == result.id for event_id, _, _ in partials)
+
+
+async def test_evaluate_closes_stream_once_json_is_complete(raw_event):
+    """Once the closing brace arrives, the stream is closed without draining it."""
+
+    class ClosableStream(FakeStream):
+        def __init__(self, text):
+            super().__init__(text)
+            self.closed = False
+
+        async def close(self):
+            self.closed = True
+
+    stream = ClosableStream(VALID_LLM_RESPONSE + "\n" + "trailing filler " * 50)
+    with patch("evaluator.client") as mock_client:
+        mock_client.chat.completions.create = AsyncMock(return_value=stream)
+
+        result = await evaluate(raw_event)
+
+    assert result is not None
+    assert stream.closed
+    assert stream._idx < len(stream._chunks)  # did not drain the filler
+
+
 async def test_evaluate_falls_back_to_event_title_when_missing(raw_event):
     """If the LLM omits 'title', the raw event title is used."""
     response_no_title = (
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -39,31 +40,31 @@ async def test_publish_respects_maxlen(queue, evaluated_event):
 
 async def test_publish_broadcasts_to_connected_clients(queue, evaluated_event):
     ws = AsyncMock()
-    queue._connections.add(ws)
+    queue._connections.append(ws)
 
     await queue.publish(evaluated_event)
 
-    ws.send_json.assert_called_once()
-    payload = ws.send_json.call_args[0][0]
+    ws.send_text.assert_called_once()
+    payload = json.loads(ws.send_text.call_args[0][0])
     assert payload["criticality"] == evaluated_event.criticality
     assert payload["category"] == evaluated_event.category
 
 
 async def test_publish_broadcasts_to_multiple_clients(queue, evaluated_event):
     ws1, ws2 = AsyncMock(), AsyncMock()
-    queue._connections.update({ws1, ws2})
+    queue._connections.extend([ws1, ws2])
 
     await queue.publish(evaluated_event)
 
-    ws1.send_json.assert_called_once()
-    ws2.send_json.assert_called_once()
+    ws1.send_text.assert_called_once()
+    ws2.send_text.assert_called_once()
 
 
 async def test_publish_removes_dead_connections(queue, evaluated_event):
     ws_dead = AsyncMock()
-    ws_dead.send_json.side_effect = Exception("connection closed")
+    ws_dead.send_text.side_effect = Exception("connection closed")
     ws_alive = AsyncMock()
-    queue._connections.update({ws_dead, ws_alive})
+    queue._connections.extend([ws_dead, ws_alive])
 
     await queue.publish(evaluated_event)
 
@@ -71,6 +72,23 @@ async def test_publish_removes_dead_connections(queue, evaluated_event):
     assert ws_alive in queue._connections
 
 
+async def test_publish_partial_broadcasts_without_storing_history(queue):
+    ws = AsyncMock()
+    queue._connections.append(ws)
+
+    await queue.publish_partial("abc123", "criticality", 7.0)
+
+    ws.send_text.assert_called_once()
+    payload = json.loads(ws.send_text.call_args[0][0])
+    assert payload == {
+        "type": "partial",
+        "id": "abc123",
+        "field": "criticality",
+        "value": 7.0,
+    }
+    assert queue.history == []
+
+
 # ─── connect / disconnect ─────────────────────────────────────────────────────
 
 
@@ -86,21 +104,21 @@ async def test_connect_replays_history(queue, evaluated_event):
     ws = AsyncMock()
     await queue.connect(ws)
 
-    # History replay: send_json called once for the existing event
-    ws.send_json.assert_called_once()
-    payload = ws.send_json.call_args[0][0]
+    # History replay: send_text called once for the existing event
+    ws.send_text.assert_called_once()
+    payload = json.loads(ws.send_text.call_args[0][0])
     assert payload["title"] == evaluated_event.title
 
 
 async def test_connect_no_history_no_replay(queue):
     ws = AsyncMock()
     await queue.connect(ws)
-    ws.send_json.assert_not_called()
+    ws.send_text.assert_not_called()
 
 
 def test_disconnect_removes_connection(queue):
     ws = MagicMock()
-    queue._connections.add(ws)
+    queue._connections.append(ws)
     queue.disconnect(ws)
     assert ws not in queue._connections
 
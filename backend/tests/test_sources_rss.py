@@ -1,114 +1,424 @@
+import xml.etree.ElementTree as ET
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import AsyncMock
 
 import pytest
 
-from sources.rss import RSSSource, MAX_ENTRIES, SEEN_CAP
+from sources.rss import RSSSource, MAX_ENTRIES, SEEN_CAP, _uid_hash
+from sources.rss_fast import parse_fast
 
 
 # ─── Fixtures & helpers ───────────────────────────────────────────────────────
 
 
 @pytest.fixture
-def rss_source():
-    return RSSSource({"name": "Test Feed", "url": "https://example.com/feed.xml"})
+def rss_source(tmp_path):
+    # state_dir keeps persisted dedup state inside the test sandbox
+    return RSSSource(
+        {
+            "name": "Test Feed",
+            "url": "https://example.com/feed.xml",
+            "state_dir": str(tmp_path),
+        }
+    )
 
 
-def make_entry(title="Test Entry", link="https://example.com/1", uid=None, summary="Test summary"):
-    """Build a feedparser-style entry object."""
-    data = {
-        "title": title,
-        "link": link,
-        "id": uid,
-        "summary": summary,
-        "description": None,
-    }
-    entry = SimpleNamespace(**{k: v for k, v in data.items()})
-    # feedparser entries also support .get()
-    entry.get = lambda key, default=None: data.get(key) if data.get(key) is not None else default
-    return entry
+@pytest.fixture
+def fake_parse(monkeypatch):
+    """Install a replacement for feedparser.parse via a single attribute write.
+
+    Also stubs the download to return non-XML bytes, so fetch() takes the
+    feedparser fallback these tests exercise. Pass a feed object (or an
+    Exception to raise). Returns the installed callable, which records call
+    kwargs in `.calls`.
+    """
+
+    def _install(feed_or_exc):
+        calls = []
 
+        def _parse(*args, **kwargs):
+            calls.append(kwargs)
+            if isinstance(feed_or_exc, Exception):
+                raise feed_or_exc
+            return feed_or_exc
 
-def make_feed(entries, feed_title="Test Feed Title"):
-    feed = SimpleNamespace(
-        entries=entries,
-        feed=SimpleNamespace(title=feed_title, get=lambda key, default="": getattr(SimpleNamespace(title=feed_title), key, default)),
+        _parse.calls = calls
+        monkeypatch.setattr(
+            RSSSource, "_download", AsyncMock(return_value=b"not-xml")
+        )
+        monkeypatch.setattr("sources.rss.feedparser.parse", _parse)
+        return _parse
+
+    return _install
+
+
+def make_entry(title="Test Entry", link="https://example.com/1", uid=None, summary="Test summary"):
+    """Build a feedparser-style entry object (fields read via getattr)."""
+    return SimpleNamespace(
+        title=title,
+        link=link,
+        id=uid,
+        summary=summary,
+        description=None,
     )
-    return feed
+
+
+RSS_XML = b"""<?xml version="1.0"?>
+<rss version="2.0">
+  <channel>
+    <title>Example Channel</title>
+    <item>
+      <title>First Item</title>
+      <link>https://example.com/1</link>
+      <guid>guid-1</guid>
+      <description>First summary</description>
+      <pubDate>Mon, 01 Jan 2025 12:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Second Item</title>
+      <link>https://example.com/2</link>
+      <guid>guid-2</guid>
+      <description>Second summary</description>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_XML = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Atom Feed</title>
+  <entry>
+    <title>Atom Entry</title>
+    <link rel="self" href="https://example.com/feed.xml"/>
+    <link rel="alternate" href="https://example.com/atom-1"/>
+    <link rel="hub" href="https://example.com/hub"/>
+    <id>atom-id-1</id>
+    <summary>Atom summary</summary>
+    <published>2025-01-01T12:00:00Z</published>
+  </entry>
+</feed>
+"""
+
+
+def make_feed(entries):
+    return SimpleNamespace(entries=entries)
 
 
 # ─── fetch() ─────────────────────────────────────────────────────────────────
 
 
-async def test_fetch_returns_raw_events(rss_source):
+async def test_fetch_returns_raw_events(rss_source, fake_parse):
     entries = [
         make_entry(f"Entry {i}", link=f"https://example.com/{i}", uid=f"uid-{i}")
         for i in range(3)
     ]
-    with patch("sources.rss.feedparser.parse", return_value=make_feed(entries)):
-        events = await rss_source.fetch()
+    fake_parse(make_feed(entries))
+    events = await rss_source.fetch()
 
     assert len(events) == 3
     assert all(e.source_name == "Test Feed" for e in events)
     assert all(e.source_type == "rss" for e in events)
 
 
-async def test_fetch_caps_at_max_entries(rss_source):
+async def test_fetch_caps_at_max_entries(rss_source, fake_parse):
     entries = [
         make_entry(f"Entry {i}", uid=f"uid-{i}") for i in range(MAX_ENTRIES + 5)
     ]
-    with patch("sources.rss.feedparser.parse", return_value=make_feed(entries)):
-        events = await rss_source.fetch()
+    fake_parse(make_feed(entries))
+    events = await rss_source.fetch()
 
     assert len(events) == MAX_ENTRIES
 
 
-async def test_fetch_deduplicates_by_uid(rss_source):
+async def test_fetch_does_not_touch_entries_beyond_cap(rss_source, fake_parse):
+    """Entries past MAX_ENTRIES must not even have their fields read."""
+
+    class CountingEntry:
+        def __init__(self, i):
+            self._data = {"id": f"uid-{i}", "title": f"Entry {i}", "link": f"https://example.com/{i}"}
+            self.accesses = 0
+
+        def __getattr__(self, name):  # only called for the feed fields
+            self.accesses += 1
+            try:
+                return self._data[name]
+            except KeyError:
+                raise AttributeError(name) from None
+
+    entries = [CountingEntry(i) for i in range(MAX_ENTRIES + 5)]
+    fake_parse(make_feed(entries))
+    await rss_source.fetch()
+
+    assert all(e.accesses > 0 for e in entries[:MAX_ENTRIES])
+    assert all(e.accesses == 0 for e in entries[MAX_ENTRIES:])
+
+
+async def test_fetch_returns_empty_list_for_empty_feed(rss_source, fake_parse):
+    fake_parse(make_feed([]))
+    events = await rss_source.fetch()
+
+    assert events == []
+
+
+async def test_fetch_deduplicates_by_uid(rss_source, fake_parse):
     entries = [make_entry("Entry", link="https://example.com/1", uid="uid-1")]
-    with patch("sources.rss.feedparser.parse", return_value=make_feed(entries)):
-        first = await rss_source.fetch()
-        second = await rss_source.fetch()
+    fake_parse(make_feed(entries))
+    first = await rss_source.fetch()
+    second = await rss_source.fetch()
 
     assert len(first) == 1
     assert len(second) == 0  # already seen
 
 
-async def test_fetch_deduplicates_by_link_when_no_id(rss_source):
+async def test_fetch_deduplicates_by_link_when_no_id(rss_source, fake_parse):
     entries = [make_entry("Entry", link="https://example.com/unique", uid=None)]
-    with patch("sources.rss.feedparser.parse", return_value=make_feed(entries)):
-        first = await rss_source.fetch()
-        second = await rss_source.fetch()
+    fake_parse(make_feed(entries))
+    first = await rss_source.fetch()
+    second = await rss_source.fetch()
 
     assert len(first) == 1
     assert len(second) == 0
 
 
-async def test_fetch_maps_fields_correctly(rss_source):
+async def test_fetch_stops_on_first_seen_when_chronological(rss_source, fake_parse):
+    """Newest-first feeds: a seen entry means everything after it is seen too."""
+    seen = make_entry("Seen", uid="uid-seen")
+    fake_parse(make_feed([seen]))
+    await rss_source.fetch()
+
+    fresh = make_entry("Fresh", uid="uid-fresh")
+    fake_parse(make_feed([seen, fresh]))
+    events = await rss_source.fetch()
+
+    assert events == []  # scan stopped at the seen entry
+
+
+async def test_fetch_scans_past_seen_entries_when_not_chronological(fake_parse, tmp_path):
+    source = RSSSource(
+        {
+            "name": "Test Feed",
+            "url": "https://example.com/feed.xml",
+            "chronological": False,
+            "state_dir": str(tmp_path),
+        }
+    )
+    seen = make_entry("Seen", uid="uid-seen")
+    fake_parse(make_feed([seen]))
+    await source.fetch()
+
+    fresh = make_entry("Fresh", uid="uid-fresh")
+    fake_parse(make_feed([seen, fresh]))
+    events = await source.fetch()
+
+    assert len(events) == 1
+    assert events[0].title == "Fresh"
+
+
+async def test_fetch_maps_fields_correctly(rss_source, fake_parse):
     entries = [make_entry("My Title", link="https://example.com/x", uid="id-x", summary="My summary")]
-    with patch("sources.rss.feedparser.parse", return_value=make_feed(entries)):
-        events = await rss_source.fetch()
+    fake_parse(make_feed(entries))
+    events = await rss_source.fetch()
 
     assert events[0].title == "My Title"
     assert events[0].url == "https://example.com/x"
     assert events[0].description == "My summary"
 
 
-async def test_fetch_handles_network_error_gracefully(rss_source):
-    with patch("sources.rss.feedparser.parse", side_effect=Exception("network timeout")):
-        events = await rss_source.fetch()
+def make_response(status_code=200, headers=None, content=b""):
+    return SimpleNamespace(
+        status_code=status_code,
+        headers=headers or {},
+        content=content,
+        raise_for_status=lambda: None,
+    )
+
+
+async def test_fetch_returns_empty_on_304_not_modified(rss_source):
+    rss_source._client.get = AsyncMock(return_value=make_response(status_code=304))
+    events = await rss_source.fetch()
+
+    assert events == []
+
+
+async def test_fetch_sends_cached_etag_and_modified(rss_source):
+    rss_source._client.get = AsyncMock(
+        return_value=make_response(
+            headers={
+                "etag": '"abc123"',
+                "last-modified": "Mon, 01 Jan 2025 00:00:00 GMT",
+            },
+            content=RSS_XML,
+        )
+    )
+    await rss_source.fetch()
+    await rss_source.fetch()
+
+    headers = rss_source._client.get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc123"'
+    assert headers["If-Modified-Since"] == "Mon, 01 Jan 2025 00:00:00 GMT"
+
+
+async def test_fetch_handles_network_error_gracefully(rss_source, fake_parse):
+    fake_parse(Exception("network timeout"))
+    events = await rss_source.fetch()
 
     assert events == []
 
 
-async def test_fetch_trims_seen_set_when_over_cap(rss_source):
-    """_seen should be trimmed when it exceeds SEEN_CAP to bound memory."""
-    # Force _seen to be just above the cap
+async def test_fetch_many_runs_sources_concurrently(monkeypatch, tmp_path):
+    import asyncio
+    import time
+    from sources.base import fetch_many
+
+    # The wait lives in the download — parsing is CPU-bound and may well
+    # serialize on a small machine, which is fine
+    async def slow_download(self, url):
+        await asyncio.sleep(0.05)
+        return b"not-xml"
+
+    monkeypatch.setattr(RSSSource, "_download", slow_download)
+    monkeypatch.setattr("sources.rss.feedparser.parse", lambda *a, **kw: make_feed([]))
+
+    srcs = [
+        RSSSource(
+            {
+                "name": f"Feed {i}",
+                "url": f"https://example.com/{i}.xml",
+                "state_dir": str(tmp_path),
+            }
+        )
+        for i in range(4)
+    ]
+    start = time.monotonic()
+    results = await fetch_many(srcs)
+    elapsed = time.monotonic() - start
+
+    assert all(r == [] for r in results)
+    assert elapsed < 0.18  # serial would be >= 4 × 0.05s
+
+
+async def test_fetch_does_not_block_event_loop(rss_source, monkeypatch):
+    """The blocking feed parse must run off-loop so other coroutines proceed."""
+    import asyncio
+    import time
+
+    order = []
+
+    def blocking_parse(*args, **kwargs):
+        time.sleep(0.05)
+        order.append("parse-done")
+        return make_feed([])
+
+    monkeypatch.setattr(RSSSource, "_download", AsyncMock(return_value=b"not-xml"))
+    monkeypatch.setattr("sources.rss.feedparser.parse", blocking_parse)
+
+    async def sentinel():
+        await asyncio.sleep(0.01)
+        order.append("sentinel")
+
+    await asyncio.gather(rss_source.fetch(), sentinel())
+
+    assert order == ["sentinel", "parse-done"]
+
+
+async def test_fetch_trims_seen_set_when_over_cap(rss_source, fake_parse):
+    """_seen should be bounded at SEEN_CAP, evicting the oldest entries first."""
+    # Force _seen to be just above the cap (keys are 64-bit uid hashes)
     from collections import OrderedDict
-    rss_source._seen = OrderedDict((str(i), None) for i in range(SEEN_CAP + 1))
+    rss_source._seen = OrderedDict((i, None) for i in range(SEEN_CAP + 1))
     assert len(rss_source._seen) > SEEN_CAP
 
     entries = [make_entry("New", link="https://example.com/new", uid="new-uid")]
-    with patch("sources.rss.feedparser.parse", return_value=make_feed(entries)):
-        await rss_source.fetch()
+    fake_parse(make_feed(entries))
+    await rss_source.fetch()
+
+    assert len(rss_source._seen) <= SEEN_CAP
+    # The newest uid survives; the oldest entries were evicted
+    assert _uid_hash("new-uid") in rss_source._seen
+    assert 0 not in rss_source._seen
+
+
+async def test_seen_state_persists_across_instances(fake_parse, tmp_path):
+    """A restarted source must not re-emit entries seen by its predecessor."""
+    config = {
+        "name": "Test Feed",
+        "url": "https://example.com/feed.xml",
+        "state_dir": str(tmp_path),
+    }
+    fake_parse(make_feed([make_entry("Entry", uid="uid-1")]))
+
+    first = await RSSSource(config).fetch()
+    second = await RSSSource(config).fetch()  # fresh instance, same state file
+
+    assert len(first) == 1
+    assert second == []
+
+
+def test_unreadable_seen_state_is_ignored(tmp_path):
+    config = {
+        "name": "Test Feed",
+        "url": "https://example.com/feed.xml",
+        "state_dir": str(tmp_path),
+    }
+    RSSSource(config)._seen_path.write_bytes(b"not json")
+
+    source = RSSSource(config)  # should not raise
+
+    assert source._seen == {}
+
+
+# ─── parse_fast ──────────────────────────────────────────────────────────────
+
+
+def test_parse_fast_reads_rss_fields():
+    entries = parse_fast(RSS_XML, limit=10)
+
+    assert len(entries) == 2
+    first = entries[0]
+    assert first.title == "First Item"
+    assert first.link == "https://example.com/1"
+    assert first.id == "guid-1"
+    assert first.summary == "First summary"
+    assert first.published_parsed[:5] == (2025, 1, 1, 12, 0)
+    assert entries[1].published_parsed is None
+
+
+def test_parse_fast_reads_atom_fields():
+    entries = parse_fast(ATOM_XML, limit=10)
+
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.title == "Atom Entry"
+    # The alternate link wins over the surrounding self/hub feed links
+    assert entry.link == "https://example.com/atom-1"
+    assert entry.id == "atom-id-1"
+    assert entry.published_parsed[:5] == (2025, 1, 1, 12, 0)
+
+
+def test_parse_fast_stops_at_limit():
+    entries = parse_fast(RSS_XML, limit=1)
+
+    assert len(entries) == 1
+    assert entries[0].title == "First Item"
+
+
+def test_parse_fast_raises_on_malformed_xml():
+    with pytest.raises(ET.ParseError):
+        parse_fast(b"this is not xml", limit=5)
+
+
+async def test_fetch_uses_fast_path_for_valid_xml(rss_source, monkeypatch):
+    """Well-formed feeds must never reach the feedparser fallback."""
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("feedparser fallback should not run")
+
+    monkeypatch.setattr(RSSSource, "_download", AsyncMock(return_value=RSS_XML))
+    monkeypatch.setattr("sources.rss.feedparser.parse", fail_parse)
+
+    events = await rss_source.fetch()
 
-    assert len(rss_source._seen) < SEEN_CAP
+    assert len(events) == 2
+    assert events[0].title == "First Item"
+    assert events[0].url == "https://example.com/1"
+    assert events[0].raw_data["published_at"] == "2025-01-01T12:00:00+00:00"
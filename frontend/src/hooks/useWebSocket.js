@@ -10,6 +10,8 @@ const RECONNECT_BACKOFF = 1.5;
  * Returns:
  *   lastEvent    — most recently received EvaluatedEvent (or null)
  *   eventHistory — full list, newest first
+ *   partialEvent — fields of the evaluation currently streaming in (or null);
+ *                  cleared when its final event arrives
  *   status       — "connecting" | "connected" | "disconnected"
  */
 export function useWebSocket() {
@@ -20,6 +22,7 @@ export function useWebSocket() {
 
   const [lastEvent, setLastEvent] = useState(null);
   const [eventHistory, setEventHistory] = useState([]);
+  const [partialEvent, setPartialEvent] = useState(null);
   const [status, setStatus] = useState("connecting");
 
   const connect = useCallback(() => {
@@ -43,6 +46,16 @@ export function useWebSocket() {
       if (!isMounted.current) return;
       try {
         const event = JSON.parse(msg.data);
+        if (event.type === "partial") {
+          // One field of an in-flight evaluation — merge by event id
+          setPartialEvent((prev) =>
+            prev && prev.id === event.id
+              ? { ...prev, [event.field]: event.value }
+              : { id: event.id, [event.field]: event.value }
+          );
+          return;
+        }
+        setPartialEvent(null);
         setLastEvent(event);
         setEventHistory((prev) => [event, ...prev].slice(0, 100));
       } catch {
@@ -82,5 +95,5 @@ export function useWebSocket() {
     };
   }, [connect]);
 
-  return { lastEvent, eventHistory, status };
+  return { lastEvent, eventHistory, partialEvent, status };
 }